@@ -1,6 +1,7 @@
 """The GMG Cloud integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import timedelta
@@ -17,14 +18,39 @@ from .const import (
     DOMAIN,
     SCAN_INTERVAL,
     SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_ACTIVE_MAX,
+    POLL_BACKOFF_FACTOR,
     SCAN_INTERVAL_IDLE,
+    SCAN_INTERVAL_SLEEP,
     SCAN_INTERVAL_BURST,
     SCAN_BURST_DURATION,
+    SLEEP_AFTER_OFFLINE_POLLS,
+    REFRESH_DEBOUNCE_DELAY,
 )
 from .api import GMGCloudApi, GMGApiError, GMGAuthError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precomputed interval timedeltas -- the poll loop compares/assigns one
+# of these every cycle, so don't rebuild them each time.
+_INTERVAL_BURST = timedelta(seconds=SCAN_INTERVAL_BURST)
+_INTERVAL_IDLE = timedelta(seconds=SCAN_INTERVAL_IDLE)
+_INTERVAL_SLEEP = timedelta(seconds=SCAN_INTERVAL_SLEEP)
+
+
+def _active_backoff_ladder() -> tuple[timedelta, ...]:
+    """Precompute the geometric backoff steps for the active tier."""
+    steps = []
+    value = float(SCAN_INTERVAL_ACTIVE)
+    while value < SCAN_INTERVAL_ACTIVE_MAX:
+        steps.append(timedelta(seconds=value))
+        value *= POLL_BACKOFF_FACTOR
+    steps.append(timedelta(seconds=SCAN_INTERVAL_ACTIVE_MAX))
+    return tuple(steps)
+
+
+_ACTIVE_BACKOFF = _active_backoff_ladder()
+
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.NUMBER, Platform.SELECT]
 
 CONFIG_SCHEMA = vol.Schema(
@@ -89,8 +115,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             grill.get("connectionType"),
         )
 
-    # Burst mode state: timestamp until which burst polling is active
-    burst_state = {"until": 0.0}
+    # Burst mode state: timestamp until which burst polling is active.
+    # offline_streak counts consecutive polls where every grill was
+    # offline, used to drop into sleep polling.
+    burst_state = {"until": 0.0, "offline_streak": 0, "backoff_idx": 0}
 
     def trigger_burst() -> None:
         """Activate burst polling (1s) for the next SCAN_BURST_DURATION seconds.
@@ -99,13 +127,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         reflects changes almost instantly.
         """
         burst_state["until"] = time.monotonic() + SCAN_BURST_DURATION
-        coordinator.update_interval = timedelta(seconds=SCAN_INTERVAL_BURST)
+        burst_state["offline_streak"] = 0
+        burst_state["backoff_idx"] = 0
+        coordinator.update_interval = _INTERVAL_BURST
         _LOGGER.debug(
             "Burst polling activated for %ds at %ds interval",
             SCAN_BURST_DURATION,
             SCAN_INTERVAL_BURST,
         )
 
+    # Per-grill state version counters. Each state dict is stamped with
+    # "_ver", which only advances when the payload content changes --
+    # entities can short-circuit their update callbacks with a single
+    # integer compare (typical win: offline grills returning a frozen
+    # payload poll after poll).
+    state_versions: dict[str, int] = {}
+    prev_states: dict[str, dict] = {}
+
     async def async_update_data() -> dict:
         """Fetch data from API.
 
@@ -113,45 +151,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         discovered from app decompilation.
 
         Dynamically adjusts polling interval:
-        - 1s  burst mode for 30s after a command is sent
-        - 2s  when any grill is actively cooking (grillState > 0)
-        - 60s when all grills are off
+        - 1s   burst mode for 30s after a command is sent
+        - 2s   when any grill is actively cooking (grillState > 0),
+               backing off geometrically to 10s while nothing changes
+               and snapping back to 2s on any observed change
+        - 60s  when all grills are off
+        - 300s when every grill has been offline for several polls in
+               a row (powered-down grills sit offline for days)
         """
         try:
-            data = {"grills": {}}
+            # _by_grill_state is a flat grill_id -> state map so entity
+            # callbacks resolve their state with a single lookup
+            data = {"grills": {}, "_by_grill_state": {}}
             any_active = False
-            for grill in api.get_cached_grills():
-                grill_id = grill.get("grillId")
-                if grill_id:
-                    state = await api.async_get_grill_state(grill)
-                    data["grills"][grill_id] = {
-                        "info": grill,
-                        "state": state,
-                        "online": state is not None,
-                    }
-                    if state and state.get("grillState", 0) > 0:
-                        any_active = True
+            grills = api.get_cached_grills()
+            # Fetch all grill states concurrently -- poll wall time stays
+            # ~1 RTT regardless of how many grills the account has.
+            states = await asyncio.gather(
+                *(api.async_get_grill_state(grill) for grill in grills),
+                return_exceptions=True,
+            )
+            for grill, state in zip(grills, states):
+                if isinstance(state, BaseException):
+                    _LOGGER.debug(
+                        "Error fetching state for grill %s: %s",
+                        grill.get("grillId"),
+                        state,
+                    )
+                    state = None
+                if state is not None:
+                    grill_id = grill["grillId"]
+                    if state != prev_states.get(grill_id):
+                        prev_states[grill_id] = dict(state)
+                        state_versions[grill_id] = state_versions.get(grill_id, 0) + 1
+                    state["_ver"] = state_versions.get(grill_id, 0)
+                data["grills"][grill["grillId"]] = {
+                    "info": grill,
+                    "state": state,
+                    "online": state is not None,
+                }
+                data["_by_grill_state"][grill["grillId"]] = state
+                if state and state.get("grillState", 0) > 0:
+                    any_active = True
+
+            all_offline = bool(grills) and not any(
+                entry["online"] for entry in data["grills"].values()
+            )
+            if all_offline:
+                burst_state["offline_streak"] += 1
+            else:
+                burst_state["offline_streak"] = 0
 
             # Determine the right polling interval
+            changed = data != coordinator.data
             now = time.monotonic()
             if now < burst_state["until"]:
                 # Burst mode still active -- keep 1s polling
-                new_interval = SCAN_INTERVAL_BURST
+                new_interval = _INTERVAL_BURST
                 mode_label = "burst"
             elif any_active:
-                new_interval = SCAN_INTERVAL_ACTIVE
+                # Back off along the precomputed ladder while the state
+                # is static (e.g. long holds at a stable temp); any
+                # change resets to the base active rate
+                if changed:
+                    burst_state["backoff_idx"] = 0
+                elif burst_state["backoff_idx"] < len(_ACTIVE_BACKOFF) - 1:
+                    burst_state["backoff_idx"] += 1
+                new_interval = _ACTIVE_BACKOFF[burst_state["backoff_idx"]]
                 mode_label = "active"
+            elif burst_state["offline_streak"] >= SLEEP_AFTER_OFFLINE_POLLS:
+                new_interval = _INTERVAL_SLEEP
+                mode_label = "sleep"
             else:
-                new_interval = SCAN_INTERVAL_IDLE
+                new_interval = _INTERVAL_IDLE
                 mode_label = "idle"
 
-            if coordinator.update_interval != timedelta(seconds=new_interval):
+            if coordinator.update_interval is not new_interval:
                 _LOGGER.debug(
-                    "Adjusting polling interval to %ds (%s)",
-                    new_interval,
+                    "Adjusting polling interval to %ss (%s)",
+                    new_interval.total_seconds(),
                     mode_label,
                 )
-                coordinator.update_interval = timedelta(seconds=new_interval)
+                coordinator.update_interval = new_interval
 
             return data
         except GMGApiError as err:
@@ -163,17 +244,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=DOMAIN,
         update_method=async_update_data,
         update_interval=timedelta(seconds=SCAN_INTERVAL),
+        # Only notify listeners when the polled data actually changed --
+        # most burst/active polls return identical state
+        always_update=False,
     )
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
+    # Coalesce rapid post-command refresh requests (e.g. target temp +
+    # mode changed within a fraction of a second) into a single poll.
+    refresh_handle: dict = {"task": None}
+
+    async def _debounced_refresh() -> None:
+        await asyncio.sleep(REFRESH_DEBOUNCE_DELAY)
+        refresh_handle["task"] = None
+        await coordinator.async_request_refresh()
+
+    def request_refresh() -> None:
+        """Request a coordinator refresh, debounced over a short window."""
+        task = refresh_handle["task"]
+        if task is None or task.done():
+            refresh_handle["task"] = hass.async_create_task(_debounced_refresh())
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
         "grills": grills,
         "trigger_burst": trigger_burst,
+        "request_refresh": request_refresh,
+        "refresh_handle": refresh_handle,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -185,6 +286,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Cancel any pending debounced refresh so it can't fire after
+        # the api client below is closed
+        task = data["refresh_handle"]["task"]
+        if task is not None and not task.done():
+            task.cancel()
         await data["api"].async_close()
 
     return unload_ok
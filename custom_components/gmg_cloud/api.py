@@ -7,6 +7,12 @@ from typing import Any
 from urllib.parse import quote
 
 import aiohttp
+import orjson
+
+try:
+    from pycognito import Cognito
+except ImportError:  # surfaced as GMGAuthError at authentication time
+    Cognito = None
 
 from .const import (
     COGNITO_USER_POOL_ID,
@@ -41,17 +47,18 @@ class GMGCloudApi:
         self.email = email
         self.password = password
         self._id_token: str | None = None
+        self._headers_cache: dict[str, str] | None = None
         self._cognito: Any = None  # Cognito instance for token refresh
+        self._refresh_lock = asyncio.Lock()
+        self._token_version = 0
         self._session: aiohttp.ClientSession | None = None
         self._grills: list[dict] = []
 
     async def async_authenticate(self) -> bool:
         """Authenticate with AWS Cognito."""
         try:
-            loop = asyncio.get_event_loop()
-            self._id_token = await loop.run_in_executor(
-                None, self._sync_authenticate
-            )
+            self._id_token = await asyncio.to_thread(self._sync_authenticate)
+            self._headers_cache = None
             return self._id_token is not None
         except Exception as err:
             _LOGGER.error("Authentication failed: %s", err)
@@ -59,9 +66,7 @@ class GMGCloudApi:
 
     def _sync_authenticate(self) -> str | None:
         """Synchronous authentication with Cognito."""
-        try:
-            from pycognito import Cognito
-        except ImportError:
+        if Cognito is None:
             _LOGGER.error("pycognito not installed")
             raise GMGAuthError("pycognito package not installed")
 
@@ -75,35 +80,69 @@ class GMGCloudApi:
         _LOGGER.info("Authenticated with GMG Cloud as %s", self.email)
         return u.id_token
 
-    async def _async_refresh_token(self) -> bool:
-        """Refresh the authentication token if expired."""
-        if not self._cognito:
-            return await self.async_authenticate()
-        try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._sync_refresh_token)
-            return True
-        except Exception as err:
-            _LOGGER.warning("Token refresh failed, re-authenticating: %s", err)
-            return await self.async_authenticate()
+    async def _async_refresh_token(self, seen_version: int | None = None) -> bool:
+        """Refresh the authentication token if expired.
+
+        Serialized behind a lock so that several requests hitting 401 at
+        once (e.g. parallel per-grill polls after token expiry) trigger a
+        single Cognito round trip; latecomers just reuse the new token.
+        """
+        async with self._refresh_lock:
+            if seen_version is not None and seen_version != self._token_version:
+                # Someone else refreshed while we waited on the lock
+                return True
+            if not self._cognito:
+                ok = await self.async_authenticate()
+            else:
+                try:
+                    await asyncio.to_thread(self._sync_refresh_token)
+                    ok = True
+                except Exception as err:
+                    _LOGGER.warning(
+                        "Token refresh failed, re-authenticating: %s", err
+                    )
+                    ok = await self.async_authenticate()
+            if ok:
+                self._token_version += 1
+            return ok
 
     def _sync_refresh_token(self) -> None:
         """Synchronous token refresh."""
         self._cognito.renew_access_token()
         self._id_token = self._cognito.id_token
+        self._headers_cache = None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get or create aiohttp session.
+
+        Uses a long-lived keep-alive connector so burst polling reuses
+        the same TLS connection instead of re-handshaking every request.
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=10,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+            )
         return self._session
 
     def _headers(self) -> dict[str, str]:
-        """Get API headers. No Bearer prefix per GMG API."""
-        return {
-            "Authorization": self._id_token,
-            "Content-Type": "application/json",
-        }
+        """Get API headers. No Bearer prefix per GMG API.
+
+        Cached until the token rotates -- rebuilt dicts per request add
+        up at burst polling rates.
+        """
+        if self._headers_cache is None:
+            self._headers_cache = {
+                "Authorization": self._id_token,
+                "Content-Type": "application/json",
+            }
+        return self._headers_cache
 
     @staticmethod
     def _grill_path(grill: dict) -> str:
@@ -111,69 +150,140 @@ class GMGCloudApi:
 
         Discovered from app decompilation: the API uses the 'sk' field format
         e.g. 'Grill|remote|41029462' -> path segment 'remote|41029462'.
+
+        Cached in the grill dict (set when the grill list is fetched) so
+        the quote() call doesn't run on every poll.
         """
-        conn_type = grill.get("connectionType", "remote")
-        grill_id = grill.get("grillId", "")
-        return quote(f"{conn_type}|{grill_id}", safe="")
+        path = grill.get("_path")
+        if path is None:
+            conn_type = grill.get("connectionType", "remote")
+            grill_id = grill.get("grillId", "")
+            path = grill["_path"] = quote(f"{conn_type}|{grill_id}", safe="")
+        return path
 
-    async def async_get_grills(self) -> list[dict]:
-        """Get list of grills for the account."""
+    @staticmethod
+    def _prime_urls(grill: dict) -> None:
+        """Precompute the per-grill endpoint URLs.
+
+        At active polling rates the state URL would otherwise be
+        re-concatenated tens of thousands of times a day.
+        """
+        path = GMGCloudApi._grill_path(grill)
+        grill["_state_url"] = f"{API_BASE_URL}/grill/{path}/state"
+        grill["_cmd_url"] = f"{API_BASE_URL}/grill/{path}/command"
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: bytes | None = None,
+        binary: bool = False,
+        _retried: bool = False,
+    ) -> tuple[int, bytes]:
+        """Issue an API request, refreshing the token once on 401/403.
+
+        Returns (status, body). The retry budget is one: if the retried
+        request also fails auth, the 401/403 is returned to the caller
+        instead of recursing forever.
+        """
         if not self._id_token:
             raise GMGApiError("Not authenticated")
 
         session = await self._ensure_session()
-        url = f"{API_BASE_URL}/grill"
+        if binary:
+            headers = {
+                "Authorization": self._id_token,
+                "Content-Type": "application/octet-stream",
+            }
+        else:
+            headers = self._headers()
+
+        token_version = self._token_version
+        async with session.request(
+            method, url, headers=headers, data=data
+        ) as response:
+            status = response.status
+            body = await response.read()
+        # Refresh and retry outside the response context so the original
+        # request's timeout isn't still ticking over a slow re-auth
+        if (status == 401 or status == 403) and not _retried:
+            _LOGGER.info("Token expired, refreshing...")
+            if await self._async_refresh_token(token_version):
+                return await self._request(
+                    method, url, data=data, binary=binary, _retried=True
+                )
+        return status, body
 
+    async def async_get_grills(self) -> list[dict]:
+        """Get list of grills for the account."""
         try:
-            async with session.get(url, headers=self._headers()) as response:
-                if response.status == 200:
-                    self._grills = await response.json()
-                    return self._grills
-                elif response.status in (401, 403):
-                    _LOGGER.info("Token expired, refreshing...")
-                    if await self._async_refresh_token():
-                        return await self.async_get_grills()
-                    return []
-                else:
-                    text = await response.text()
-                    _LOGGER.error("Failed to get grills: %s - %s", response.status, text)
-                    return []
-        except Exception as err:
+            status, body = await self._request("GET", f"{API_BASE_URL}/grill")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error getting grills: %s", err)
             return []
 
+        if status == 200:
+            # orjson is noticeably faster than stdlib json on
+            # low-end hosts polling every second or two
+            try:
+                grills = orjson.loads(body)
+            except ValueError as err:
+                _LOGGER.error("Malformed grill list response: %s", err)
+                return []
+            # Filter out entries without a grillId here so the poll loop
+            # doesn't have to re-check every cycle
+            self._grills = [g for g in grills if g.get("grillId")]
+            if len(self._grills) != len(grills):
+                _LOGGER.warning(
+                    "Ignoring %d grill entry(ies) without a grillId",
+                    len(grills) - len(self._grills),
+                )
+            for grill in self._grills:
+                self._prime_urls(grill)
+            return self._grills
+        if _LOGGER.isEnabledFor(logging.ERROR):
+            _LOGGER.error(
+                "Failed to get grills: %s - %s",
+                status,
+                body.decode(errors="replace")[:200],
+            )
+        return []
+
     async def async_get_grill_state(self, grill: dict) -> dict | None:
         """Get current state of a grill.
 
         Uses the correct endpoint: /grill/{connectionType}|{grillId}/state
         """
-        if not self._id_token:
-            raise GMGApiError("Not authenticated")
-
-        session = await self._ensure_session()
-        path = self._grill_path(grill)
-        url = f"{API_BASE_URL}/grill/{path}/state"
+        url = grill.get("_state_url")
+        if url is None:
+            self._prime_urls(grill)
+            url = grill["_state_url"]
 
         try:
-            async with session.get(url, headers=self._headers()) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status in (401, 403):
-                    _LOGGER.info("Token expired, refreshing...")
-                    if await self._async_refresh_token():
-                        return await self.async_get_grill_state(grill)
-                    return None
-                elif response.status == 404:
-                    _LOGGER.debug("Grill %s not currently online", grill.get("grillId"))
-                    return None
-                else:
-                    text = await response.text()
-                    _LOGGER.warning("Failed to get grill state: %s - %s", response.status, text[:200])
-                    return None
-        except Exception as err:
+            status, body = await self._request("GET", url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error getting grill state: %s", err)
             return None
 
+        if status == 200:
+            try:
+                return orjson.loads(body)
+            except ValueError as err:
+                _LOGGER.error("Malformed grill state response: %s", err)
+                return None
+        if status == 404:
+            _LOGGER.debug("Grill %s not currently online", grill.get("grillId"))
+        elif _LOGGER.isEnabledFor(logging.WARNING):
+            # Don't decode the error body unless it's actually logged --
+            # repeated failures during token churn would churn strings too
+            _LOGGER.warning(
+                "Failed to get grill state: %s - %s",
+                status,
+                body.decode(errors="replace")[:200],
+            )
+        return None
+
     async def async_send_command(
         self, grill: dict, command_data: bytes
     ) -> bool:
@@ -182,36 +292,30 @@ class GMGCloudApi:
         Uses the correct endpoint: /grill/{connectionType}|{grillId}/command
         with Content-Type: application/octet-stream (binary payload).
         """
-        if not self._id_token:
-            raise GMGApiError("Not authenticated")
-
-        session = await self._ensure_session()
-        path = self._grill_path(grill)
-        url = f"{API_BASE_URL}/grill/{path}/command"
-
-        headers = {
-            "Authorization": self._id_token,
-            "Content-Type": "application/octet-stream",
-        }
+        url = grill.get("_cmd_url")
+        if url is None:
+            self._prime_urls(grill)
+            url = grill["_cmd_url"]
 
         try:
-            async with session.put(url, headers=headers, data=command_data) as response:
-                if response.status in (200, 201, 202):
-                    _LOGGER.info("Command sent successfully to %s", grill.get("grillId"))
-                    return True
-                elif response.status in (401, 403):
-                    _LOGGER.info("Token expired, refreshing...")
-                    if await self._async_refresh_token():
-                        return await self.async_send_command(grill, command_data)
-                    return False
-                else:
-                    text = await response.text()
-                    _LOGGER.error("Failed to send command: %s - %s", response.status, text[:200])
-                    return False
-        except Exception as err:
+            status, body = await self._request(
+                "PUT", url, data=command_data, binary=True
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error sending command: %s", err)
             return False
 
+        if 200 <= status < 300:
+            _LOGGER.debug("Command sent successfully to %s", grill.get("grillId"))
+            return True
+        if _LOGGER.isEnabledFor(logging.ERROR):
+            _LOGGER.error(
+                "Failed to send command: %s - %s",
+                status,
+                body.decode(errors="replace")[:200],
+            )
+        return False
+
     # ── Command helpers ──────────────────────────────────────────────
     # Plaintext ASCII commands discovered from GMG Prime app decompilation.
     # Sent via PUT /grill/{connectionType}|{grillId}/command
@@ -45,6 +45,8 @@ class GMGLowPelletsSensor(CoordinatorEntity, BinarySensorEntity):
     the app's warningItemBuilder in gmg_warning_view.dart.
     """
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_avail")
+
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
@@ -62,10 +64,7 @@ class GMGLowPelletsSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_low_pellets"
         self._attr_name = "Low Pellets"
         self._attr_is_on = False
-
-    @property
-    def available(self) -> bool:
-        return True
+        self._last_avail = True
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -80,15 +79,34 @@ class GMGLowPelletsSensor(CoordinatorEntity, BinarySensorEntity):
     def icon(self) -> str:
         return "mdi:fire-alert" if self._attr_is_on else "mdi:fire"
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data:
-                state = grill_data.get("state")
-                if state:
-                    # warningCode 2 = low pellets
-                    self._attr_is_on = state.get("warningCode", 0) == 2
-                else:
-                    self._attr_is_on = False
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        new_on = self._attr_is_on
+        grill_data = (self.coordinator.data or {}).get("grills", {}).get(self._grill_id)
+        if grill_data:
+            state = grill_data.get("state")
+            # warningCode 2 = low pellets
+            new_on = bool(state and state.get("warningCode", 0) == 2)
+        # Skip the state-machine write when nothing changed -- at burst
+        # polling rates almost every update is a no-op. Availability
+        # flips still get written even when the value didn't move.
+        avail = self.coordinator.last_update_success
+        if new_on == self._attr_is_on and avail == self._last_avail:
+            return
+        self._last_avail = avail
+        self._attr_is_on = new_on
         self.async_write_ha_state()
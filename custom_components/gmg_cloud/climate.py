@@ -42,10 +42,13 @@ async def async_setup_entry(
     api = data["api"]
     grills = data["grills"]
     trigger_burst = data.get("trigger_burst")
+    request_refresh = data.get("request_refresh")
 
     entities = []
     for grill in grills:
-        entities.append(GMGClimateEntity(coordinator, api, grill, trigger_burst))
+        entities.append(
+            GMGClimateEntity(coordinator, api, grill, trigger_burst, request_refresh)
+        )
 
     async_add_entities(entities)
 
@@ -53,6 +56,20 @@ async def async_setup_entry(
 class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
     """GMG Grill climate entity."""
 
+    __slots__ = (
+        "_api",
+        "_grill",
+        "_trigger_burst",
+        "_request_refresh",
+        "_grill_id",
+        "_grill_name",
+        "_target_temp",
+        "_current_temp",
+        "_hvac_mode",
+        "_is_online",
+        "_last_avail",
+    )
+
     _attr_has_entity_name = True
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.FAN_ONLY]
@@ -60,6 +77,9 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
     _attr_min_temp = MIN_TEMP_F
     _attr_max_temp = MAX_TEMP_F
     _attr_target_temperature_step = 5
+    # Commands can always be sent; the grill applies them when it comes
+    # online, so report assumed state rather than overriding available.
+    _attr_assumed_state = True
 
     def __init__(
         self,
@@ -67,12 +87,14 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
         api: GMGCloudApi,
         grill: dict,
         trigger_burst: callable = None,
+        request_refresh: callable = None,
     ) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._api = api
         self._grill = grill
         self._trigger_burst = trigger_burst
+        self._request_refresh = request_refresh
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
         
@@ -84,6 +106,7 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
         self._current_temp: float | None = None
         self._hvac_mode = HVACMode.OFF
         self._is_online = False
+        self._last_avail = True
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -95,12 +118,6 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
             "model": self._grill.get("bleName", "GMG Grill"),
         }
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        # Always available for control, but state may be unknown
-        return True
-
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
@@ -125,54 +142,91 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
             "online": self._is_online,
         }
         # Add live state fields if available
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data and grill_data.get("state"):
-                state = grill_data["state"]
-                attrs.update({
-                    "fire_state": state.get("fireState"),
-                    "grill_state": state.get("grillState"),
-                    "grill_mode": state.get("grillMode"),
-                    "warning_code": state.get("warningCode"),
-                    "firmware_version": state.get("firmwareVersion"),
-                    "last_updated": state.get("lastUpdated"),
-                })
+        grill_data = (self.coordinator.data or {}).get("grills", {}).get(self._grill_id)
+        if grill_data and grill_data.get("state"):
+            state = grill_data["state"]
+            attrs.update({
+                "fire_state": state.get("fireState"),
+                "grill_state": state.get("grillState"),
+                "grill_mode": state.get("grillMode"),
+                "warning_code": state.get("warningCode"),
+                "firmware_version": state.get("firmwareVersion"),
+                "last_updated": state.get("lastUpdated"),
+            })
         return attrs
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data:
-                self._is_online = grill_data.get("online", False)
-                state = grill_data.get("state")
-                if state:
-                    # Parse state data -- field names from the API response
-                    self._current_temp = state.get("grillTemp")
-                    target = state.get("setGrillTemp")
-                    if target and target > 0:
-                        self._target_temp = target
-
-                    # Determine HVAC mode from grillState enum
-                    # grillState: 0=off, 1=grillMode, 2=fanMode, 3=smokeMode
-                    grill_state = state.get("grillState", 0)
-                    if grill_state in (1, 3):  # grillMode or smokeMode
-                        self._hvac_mode = HVACMode.HEAT
-                    elif grill_state == 2:  # fanMode (cool-down cycle)
-                        self._hvac_mode = HVACMode.FAN_ONLY
-                    else:
-                        self._hvac_mode = HVACMode.OFF
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        previous = (
+            self._current_temp,
+            self._target_temp,
+            self._hvac_mode,
+            self._is_online,
+            self._last_avail,
+        )
+        grill_data = (self.coordinator.data or {}).get("grills", {}).get(self._grill_id)
+        if grill_data:
+            self._is_online = grill_data.get("online", False)
+            state = grill_data.get("state")
+            if state:
+                # Parse state data -- field names from the API response
+                self._current_temp = state.get("grillTemp")
+                target = state.get("setGrillTemp")
+                if target and target > 0:
+                    self._target_temp = target
+
+                # Determine HVAC mode from grillState enum
+                # grillState: 0=off, 1=grillMode, 2=fanMode, 3=smokeMode
+                grill_state = state.get("grillState", 0)
+                if grill_state in (1, 3):  # grillMode or smokeMode
+                    self._hvac_mode = HVACMode.HEAT
+                elif grill_state == 2:  # fanMode (cool-down cycle)
+                    self._hvac_mode = HVACMode.FAN_ONLY
                 else:
-                    self._is_online = False
+                    self._hvac_mode = HVACMode.OFF
+            else:
+                self._is_online = False
 
-        self.async_write_ha_state()
+        # Only push to the state machine when something actually changed;
+        # availability flips must get through even when the data didn't
+        avail = self.coordinator.last_update_success
+        if (
+            self._current_temp,
+            self._target_temp,
+            self._hvac_mode,
+            self._is_online,
+            avail,
+        ) != previous:
+            self._last_avail = avail
+            self.async_write_ha_state()
 
     def _activate_burst(self) -> None:
         """Activate burst polling after a command."""
         if self._trigger_burst:
             self._trigger_burst()
 
+    async def _async_refresh_soon(self) -> None:
+        """Request a coordinator refresh, debounced when available."""
+        if self._request_refresh:
+            self._request_refresh()
+        else:
+            await self.coordinator.async_request_refresh()
+
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode (power on/off).
 
@@ -184,13 +238,13 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
                 self._hvac_mode = HVACMode.OFF
                 self.async_write_ha_state()
                 self._activate_burst()
-                await self.coordinator.async_request_refresh()
+                await self._async_refresh_soon()
         elif hvac_mode == HVACMode.HEAT:
             if await self._api.async_power_on_grill(self._grill):
                 self._hvac_mode = HVACMode.HEAT
                 self.async_write_ha_state()
                 self._activate_burst()
-                await self.coordinator.async_request_refresh()
+                await self._async_refresh_soon()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set grill target temperature (150-550°F)."""
@@ -200,7 +254,7 @@ class GMGClimateEntity(CoordinatorEntity, ClimateEntity):
                 self._target_temp = temp
                 self.async_write_ha_state()
                 self._activate_burst()
-                await self.coordinator.async_request_refresh()
+                await self._async_refresh_soon()
 
     async def async_turn_on(self) -> None:
         """Turn the grill on."""
@@ -1,7 +1,9 @@
 """Config flow for GMG Cloud integration."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -22,6 +24,19 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Recently validated credentials: (email, password digest) -> (monotonic
+# timestamp, grills). Rapid form resubmissions with the same credentials
+# skip the Cognito round trips entirely. Only a truncated hash of the
+# password is kept.
+_AUTH_CACHE: dict[tuple[str, str], tuple[float, list]] = {}
+_AUTH_CACHE_TTL = 60  # seconds
+
+
+def _auth_cache_key(email: str, password: str) -> tuple[str, str]:
+    """Build the auth-cache key for a set of credentials."""
+    digest = hashlib.sha256(password.encode()).hexdigest()[:16]
+    return (email, digest)
+
 
 class GMGCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for GMG Cloud."""
@@ -48,14 +63,34 @@ class GMGCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(email)
             self._abort_if_unique_id_configured()
 
+            # Skip the Cognito round trips if these exact credentials
+            # were validated moments ago (e.g. form resubmission)
+            cache_key = _auth_cache_key(email, password)
+            cached = _AUTH_CACHE.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _AUTH_CACHE_TTL:
+                if cached[1]:
+                    return self.async_create_entry(
+                        title=f"GMG ({email})",
+                        data={
+                            CONF_EMAIL: email,
+                            CONF_PASSWORD: password,
+                        },
+                    )
+                errors["base"] = "no_grills"
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=STEP_USER_DATA_SCHEMA,
+                    errors=errors,
+                )
+
             # Try to authenticate
             api = GMGCloudApi(email, password)
             try:
                 if await api.async_authenticate():
                     # Get grills to verify account has grills
                     grills = await api.async_get_grills()
-                    await api.async_close()
-                    
+                    _AUTH_CACHE[cache_key] = (time.monotonic(), grills)
+
                     if grills:
                         return self.async_create_entry(
                             title=f"GMG ({email})",
@@ -17,9 +17,14 @@ TCP_PORT = 8061
 # Polling intervals (seconds)
 SCAN_INTERVAL = 30  # default / fallback
 SCAN_INTERVAL_ACTIVE = 2  # when grill is on (grillState > 0)
+SCAN_INTERVAL_ACTIVE_MAX = 10  # active-tier ceiling while nothing is changing
+POLL_BACKOFF_FACTOR = 1.5  # geometric growth per unchanged active poll
 SCAN_INTERVAL_IDLE = 60  # when grill is off
+SCAN_INTERVAL_SLEEP = 300  # when all grills have been offline for a while
 SCAN_INTERVAL_BURST = 1  # after a command is sent
 SCAN_BURST_DURATION = 30  # how long burst mode lasts (seconds)
+SLEEP_AFTER_OFFLINE_POLLS = 5  # consecutive all-offline polls before sleep mode
+REFRESH_DEBOUNCE_DELAY = 0.25  # coalescing window for post-command refreshes
 
 # Config keys
 CONF_EMAIL = "email"
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -55,6 +54,19 @@ class GMGProbeTargetNumber(CoordinatorEntity, NumberEntity):
     Probe 2: Uf{NNN}! command, reads setFoodTemp2 from state.
     """
 
+    __slots__ = (
+        "_api",
+        "_grill",
+        "_probe",
+        "_trigger_burst",
+        "_grill_id",
+        "_grill_name",
+        "_api_field",
+        "_set_fn",
+        "_last_ver",
+        "_last_avail",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = NumberDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
@@ -79,49 +91,73 @@ class GMGProbeTargetNumber(CoordinatorEntity, NumberEntity):
         self._trigger_burst = trigger_burst
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._grill_id)},
+            "name": self._grill_name,
+            "manufacturer": "Green Mountain Grills",
+            "model": grill.get("bleName", "GMG Grill"),
+        }
 
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_probe{probe}_target"
         self._attr_name = f"Probe {probe} Target Temp"
         self._attr_native_value = None
         self._api_field = "setFoodTemp" if probe == 1 else "setFoodTemp2"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._grill_id)},
-            "name": self._grill_name,
-            "manufacturer": "Green Mountain Grills",
-            "model": self._grill.get("bleName", "GMG Grill"),
-        }
+        self._set_fn = (
+            api.async_set_food_probe1_temp
+            if probe == 1
+            else api.async_set_food_probe2_temp
+        )
+        self._last_ver: int | None = None
+        self._last_avail = True
 
     @property
     def icon(self) -> str:
         """Return icon."""
         return "mdi:thermometer-lines"
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data:
-                state = grill_data.get("state")
-                if state:
-                    val = state.get(self._api_field, 0)
-                    # 0 means "not set" -- show as None
-                    self._attr_native_value = val if val > 0 else None
-                else:
-                    self._attr_native_value = None
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        avail = self.coordinator.last_update_success
+        new_val = self._attr_native_value
+        data = self.coordinator.data
+        if data:
+            state = data["_by_grill_state"].get(self._grill_id)
+            ver = state.get("_ver") if state else None
+            if ver is not None and ver == self._last_ver and avail == self._last_avail:
+                return
+            self._last_ver = ver
+            if state:
+                val = state.get(self._api_field, 0)
+                # 0 means "not set" -- show as None
+                new_val = val if val > 0 else None
+            else:
+                new_val = None
+        # Availability flips still get written even when the value didn't move
+        if new_val == self._attr_native_value and avail == self._last_avail:
+            return
+        self._last_avail = avail
+        self._attr_native_value = new_val
         self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the probe target temperature."""
         temp = int(value)
-        if self._probe == 1:
-            success = await self._api.async_set_food_probe1_temp(self._grill, temp)
-        else:
-            success = await self._api.async_set_food_probe2_temp(self._grill, temp)
+        success = await self._set_fn(self._grill, temp)
 
         if success:
             self._attr_native_value = temp
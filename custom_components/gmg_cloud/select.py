@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -18,6 +17,14 @@ from .api import GMGCloudApi
 
 _LOGGER = logging.getLogger(__name__)
 
+# Icon per selected mode; a dict hit beats re-running the string
+# comparisons every time the frontend asks for the icon
+_MODE_ICONS = {
+    "smoke": "mdi:smoke",
+    "pizza": "mdi:pizza",
+    "grill": "mdi:grill",
+}
+
 # Grill modes and their power-on commands
 GRILL_MODES = {
     "grill": "UK001!",   # Standard grill mode
@@ -37,10 +44,13 @@ async def async_setup_entry(
     api = data["api"]
     grills = data["grills"]
     trigger_burst = data.get("trigger_burst")
+    request_refresh = data.get("request_refresh")
 
     entities = []
     for grill in grills:
-        entities.append(GMGGrillModeSelect(coordinator, api, grill, trigger_burst))
+        entities.append(
+            GMGGrillModeSelect(coordinator, api, grill, trigger_burst, request_refresh)
+        )
 
     async_add_entities(entities)
 
@@ -57,6 +67,17 @@ class GMGGrillModeSelect(CoordinatorEntity, SelectEntity):
     and restart in the new mode.
     """
 
+    __slots__ = (
+        "_api",
+        "_grill",
+        "_trigger_burst",
+        "_request_refresh",
+        "_grill_id",
+        "_grill_name",
+        "_last_ver",
+        "_last_avail",
+    )
+
     _attr_has_entity_name = True
     _attr_options = list(GRILL_MODES.keys())
 
@@ -66,38 +87,43 @@ class GMGGrillModeSelect(CoordinatorEntity, SelectEntity):
         api: GMGCloudApi,
         grill: dict,
         trigger_burst: callable = None,
+        request_refresh: callable = None,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
         self._api = api
         self._grill = grill
         self._trigger_burst = trigger_burst
+        self._request_refresh = request_refresh
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
-
-        self._attr_unique_id = f"gmg_cloud_{self._grill_id}_grill_mode"
-        self._attr_name = "Grill Mode"
-        self._attr_current_option = "grill"  # Default
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info."""
-        return {
+        self._attr_device_info = {
             "identifiers": {(DOMAIN, self._grill_id)},
             "name": self._grill_name,
             "manufacturer": "Green Mountain Grills",
-            "model": self._grill.get("bleName", "GMG Grill"),
+            "model": grill.get("bleName", "GMG Grill"),
         }
 
+        self._attr_unique_id = f"gmg_cloud_{self._grill_id}_grill_mode"
+        self._attr_name = "Grill Mode"
+        self._attr_current_option = "grill"  # Default
+        self._last_ver: int | None = None
+        self._last_avail = True
+
     @property
     def icon(self) -> str:
         """Return icon based on current mode."""
-        mode = self._attr_current_option
-        if mode == "smoke":
-            return "mdi:smoke"
-        elif mode == "pizza":
-            return "mdi:pizza"
-        return "mdi:grill"
+        return _MODE_ICONS.get(self._attr_current_option, "mdi:grill")
+
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -107,20 +133,34 @@ class GMGGrillModeSelect(CoordinatorEntity, SelectEntity):
         grillState 1 = grillMode, 3 = smokeMode.
         grillMode field may also indicate pizza mode.
         """
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data:
-                state = grill_data.get("state")
-                if state:
-                    grill_state = state.get("grillState", 0)
-                    grill_mode = state.get("grillMode", 0)
-                    if grill_state == 3:
-                        self._attr_current_option = "smoke"
-                    elif grill_mode == 3:
-                        self._attr_current_option = "pizza"
-                    elif grill_state in (1, 2):
-                        self._attr_current_option = "grill"
-                    # When off (grillState==0), keep the last selected mode
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        avail = self.coordinator.last_update_success
+        new_option = self._attr_current_option
+        data = self.coordinator.data
+        if data:
+            state = data["_by_grill_state"].get(self._grill_id)
+            ver = state.get("_ver") if state else None
+            if ver is not None and ver == self._last_ver and avail == self._last_avail:
+                return
+            self._last_ver = ver
+            if state:
+                grill_state = state.get("grillState", 0)
+                grill_mode = state.get("grillMode", 0)
+                if grill_state == 3:
+                    new_option = "smoke"
+                elif grill_mode == 3:
+                    new_option = "pizza"
+                elif grill_state in (1, 2):
+                    new_option = "grill"
+                # When off (grillState==0), keep the last selected mode
+        # Availability flips still get written even when the option didn't move
+        if new_option == self._attr_current_option and avail == self._last_avail:
+            return
+        self._last_avail = avail
+        self._attr_current_option = new_option
         self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
@@ -129,18 +169,27 @@ class GMGGrillModeSelect(CoordinatorEntity, SelectEntity):
         If the grill is currently running, this will restart it in the new mode.
         If the grill is off, this just sets the mode for the next power-on.
         """
+        # Show the new mode and start burst polling immediately -- the
+        # restart below takes two round trips and the next polls will
+        # correct the optimistic state if anything went wrong.
         self._attr_current_option = option
+        self.async_write_ha_state()
+        if self._trigger_burst:
+            self._trigger_burst()
 
         # Check if grill is currently on
         is_on = False
-        if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data and grill_data.get("state"):
-                grill_state = grill_data["state"].get("grillState", 0)
+        data = self.coordinator.data
+        if data:
+            state = data["_by_grill_state"].get(self._grill_id)
+            if state:
+                grill_state = state.get("grillState", 0)
                 is_on = grill_state in (1, 3)  # grillMode or smokeMode
 
         if is_on:
-            # Grill is running -- power off then restart in new mode
+            # Grill is running -- power off then restart in new mode.
+            # The controller needs the commands sequentially, so these
+            # can't be pipelined.
             await self._api.async_power_off(self._grill)
             # Send power-on in the new mode
             if option == "smoke":
@@ -150,7 +199,7 @@ class GMGGrillModeSelect(CoordinatorEntity, SelectEntity):
             else:
                 await self._api.async_power_on_grill(self._grill)
 
-        self.async_write_ha_state()
-        if self._trigger_burst:
-            self._trigger_burst()
-        await self.coordinator.async_request_refresh()
+        if self._request_refresh:
+            self._request_refresh()
+        else:
+            self.hass.async_create_task(self.coordinator.async_request_refresh())
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import logging
+import re
 import time
 from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -25,23 +28,24 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-# Warning codes from app decompilation (warningItemBuilder)
-WARNING_CODES = {
-    0: "none",
-    1: "fan_mode",
-    2: "low_pellets",
-    3: "ignitor_disconnect",
-    4: "auger_disconnect",
-    5: "fan_disconnect",
-}
+# Warning codes from app decompilation (warningItemBuilder). Codes are
+# dense small ints, so index the tuple directly instead of a dict lookup.
+WARNING_CODES = (
+    "none",  # 0
+    "fan_mode",  # 1
+    "low_pellets",  # 2
+    "ignitor_disconnect",  # 3
+    "auger_disconnect",  # 4
+    "fan_disconnect",  # 5
+)
 
-# grillState enum from app decompilation
-GRILL_STATES = {
-    0: "off",
-    1: "grilling",
-    2: "fan_mode",
-    3: "smoking",
-}
+# grillState enum from app decompilation, indexed by state
+GRILL_STATES = (
+    "off",  # 0
+    "grilling",  # 1
+    "fan_mode",  # 2
+    "smoking",  # 3
+)
 
 # fireState enum from community reverse engineering
 # Source: github.com/brandenc40/green-mountain-grill
@@ -56,26 +60,113 @@ FIRE_STATES = {
     255: "cooldown",
 }
 
+# API timestamps look like "2026-02-08T06:36:20.744505113Z" (nanosecond
+# precision); match the pieces directly rather than string-juggling into
+# a form fromisoformat accepts
+_TS_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z?$"
+)
+
+
+# Icon lookups keyed on the current sensor value -- built once so the
+# icon properties are a single dict hit rather than an if/elif chain
+_STATUS_ICONS = {
+    "grilling": "mdi:fire",
+    "smoking": "mdi:fire",
+    "fan_mode": "mdi:fan",
+    "online": "mdi:grill",
+}
+
+_FIRE_STATE_ICONS = {
+    "running": "mdi:fire",
+    "startup": "mdi:fire-alert",
+    "cool_down": "mdi:fan",
+    "cold_smoke": "mdi:smoke",
+    "fail": "mdi:alert-circle",
+}
+
+# Indexed by bool(profile active) / bool(ETA available)
+_PROFILE_ICONS = ("mdi:playlist-remove", "mdi:playlist-play")
+_ETA_ICONS = ("mdi:timer-off-outline", "mdi:timer-sand")
+
+_WARNING_ICONS = {
+    "none": "mdi:check-circle-outline",
+    "low_pellets": "mdi:fire-alert",
+    "fan_mode": "mdi:fan-alert",
+    "fan_disconnect": "mdi:fan-alert",
+    "ignitor_disconnect": "mdi:fire-off",
+    "auger_disconnect": "mdi:cog-off",
+}
+
+# (unique-id key, display name, state field) for each temperature sensor
+_PROBE_SENSOR_DESCRIPTIONS = (
+    ("grill_temp", "Grill Temp", "grillTemp"),
+    ("probe1", "Food Probe 1", "foodTemp"),
+    ("probe2", "Food Probe 2", "foodTemp2"),
+    ("target_grill", "Target Grill Temp", "setGrillTemp"),
+    ("target_probe1", "Target Probe 1 Temp", "setFoodTemp"),
+    ("target_probe2", "Target Probe 2 Temp", "setFoodTemp2"),
+)
+
+# (probe number, temp field, target field) for the ETA sensors
+_ETA_SENSOR_DESCRIPTIONS = (
+    (1, "foodTemp", "setFoodTemp"),
+    (2, "foodTemp2", "setFoodTemp2"),
+)
+
 
 def _device_info(grill: dict, grill_id: str, grill_name: str) -> dict[str, Any]:
-    """Return shared device info for all sensors."""
-    return {
-        "identifiers": {(DOMAIN, grill_id)},
-        "name": grill_name,
-        "manufacturer": "Green Mountain Grills",
-        "model": grill.get("bleName", "GMG Grill"),
-    }
+    """Return shared device info for all sensors.
+
+    Cached on the grill dict so every sensor for a grill holds the same
+    object instead of building its own copy.
+    """
+    info = grill.get("_device_info")
+    if info is None:
+        info = grill["_device_info"] = {
+            "identifiers": {(DOMAIN, grill_id)},
+            "name": grill_name,
+            "manufacturer": "Green Mountain Grills",
+            "model": grill.get("bleName", "GMG Grill"),
+        }
+    return info
 
 
 def _get_state(coordinator: DataUpdateCoordinator, grill_id: str) -> dict | None:
     """Get the grill state dict from coordinator data."""
-    if coordinator.data:
-        grill_data = coordinator.data.get("grills", {}).get(grill_id)
-        if grill_data:
-            return grill_data.get("state")
+    data = coordinator.data
+    if data:
+        return data["_by_grill_state"].get(grill_id)
     return None
 
 
+def _make_probe_dispatcher(
+    coordinator: DataUpdateCoordinator,
+    grill_id: str,
+    sensors: list[GMGProbeSensor],
+) -> Callable[[], None]:
+    """Build one coordinator listener covering a grill's temperature sensors.
+
+    The temperature sensors all read fields from the same state dict;
+    resolving it once per poll replaces six identical walks, and a single
+    version check covers all of them.
+    """
+    last_ver: int | None = None
+
+    @callback
+    def _dispatch() -> None:
+        nonlocal last_ver
+        state = _get_state(coordinator, grill_id)
+        ver = state.get("_ver") if state else None
+        if ver is not None and ver == last_ver:
+            return
+        last_ver = ver
+        for sensor in sensors:
+            sensor.update_from_state(state)
+
+    return _dispatch
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -86,29 +177,28 @@ async def async_setup_entry(
     coordinator = data["coordinator"]
     grills = data["grills"]
 
-    entities = []
+    entities: list[SensorEntity] = []
     for grill in grills:
-        grill_id = grill.get("grillId", "unknown")
-
-        # Temperature sensors
-        entities.append(GMGProbeSensor(coordinator, grill, "grill_temp", "Grill Temp", "grillTemp"))
-        entities.append(GMGProbeSensor(coordinator, grill, "probe1", "Food Probe 1", "foodTemp"))
-        entities.append(GMGProbeSensor(coordinator, grill, "probe2", "Food Probe 2", "foodTemp2"))
-        entities.append(GMGProbeSensor(coordinator, grill, "target_grill", "Target Grill Temp", "setGrillTemp"))
-        entities.append(GMGProbeSensor(coordinator, grill, "target_probe1", "Target Probe 1 Temp", "setFoodTemp"))
-        entities.append(GMGProbeSensor(coordinator, grill, "target_probe2", "Target Probe 2 Temp", "setFoodTemp2"))
-
+        # Temperature sensors, updated in bulk by one listener per grill
+        probe_sensors = [
+            GMGProbeSensor(coordinator, grill, key, name, api_field)
+            for key, name, api_field in _PROBE_SENSOR_DESCRIPTIONS
+        ]
+        entities.extend(probe_sensors)
+        entry.async_on_unload(
+            coordinator.async_add_listener(
+                _make_probe_dispatcher(
+                    coordinator, grill.get("grillId", "unknown"), probe_sensors
+                )
+            )
+        )
         # Status sensors
-        entities.append(GMGStatusSensor(coordinator, grill))
-        entities.append(GMGWarningSensor(coordinator, grill))
-        entities.append(GMGFireStateSensor(coordinator, grill))
-        entities.append(GMGProfileSensor(coordinator, grill))
-        entities.append(GMGFirmwareSensor(coordinator, grill))
-        entities.append(GMGLastUpdatedSensor(coordinator, grill))
-
+        entities.extend(cls(coordinator, grill) for cls in _STATUS_SENSOR_CLASSES)
         # ETA sensors (estimate time for probes to reach target temp)
-        entities.append(GMGProbeETASensor(coordinator, grill, 1, "foodTemp", "setFoodTemp"))
-        entities.append(GMGProbeETASensor(coordinator, grill, 2, "foodTemp2", "setFoodTemp2"))
+        entities.extend(
+            GMGProbeETASensor(coordinator, grill, probe, temp_field, target_field)
+            for probe, temp_field, target_field in _ETA_SENSOR_DESCRIPTIONS
+        )
 
     async_add_entities(entities)
 
@@ -116,6 +206,8 @@ async def async_setup_entry(
 class GMGProbeSensor(CoordinatorEntity, SensorEntity):
     """GMG temperature sensor -- used for grill temp, probe temps, and target temps."""
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_api_field", "_is_target")
+
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -134,7 +226,9 @@ class GMGProbeSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._api_field = api_field
+        self._is_target = api_field.startswith("set")
 
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_{key}"
         self._attr_name = name
@@ -144,28 +238,43 @@ class GMGProbeSensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
+    async def async_added_to_hass(self) -> None:
+        """Seed from data the coordinator already holds.
+
+        The dispatcher only runs on coordinator notifications, which a
+        static grill payload never triggers after a restart.
+        """
+        await super().async_added_to_hass()
+        self.update_from_state(_get_state(self.coordinator, self._grill_id))
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        state = _get_state(self.coordinator, self._grill_id)
+        """No-op: updates arrive through the per-grill dispatcher."""
+
+    @callback
+    def update_from_state(self, state: dict | None) -> None:
+        """Apply a grill state resolved by the dispatcher."""
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        new_val = None
         if state:
             val = state.get(self._api_field)
             # Target temps of 0 mean "not set" -- show as None
-            if self._api_field.startswith("set") and val == 0:
-                self._attr_native_value = None
-            else:
-                self._attr_native_value = val
-        else:
-            self._attr_native_value = None
+            if not (self._is_target and val == 0):
+                new_val = val
+        if new_val == self._attr_native_value:
+            return
+        self._attr_native_value = new_val
         self.async_write_ha_state()
 
 
 class GMGStatusSensor(CoordinatorEntity, SensorEntity):
     """GMG grill connection/operating status sensor."""
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_ver")
+
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: DataUpdateCoordinator, grill: dict) -> None:
@@ -173,39 +282,57 @@ class GMGStatusSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_status"
         self._attr_name = "Status"
         self._attr_native_value = "offline"
+        self._last_ver: int | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
-        val = self._attr_native_value
-        if val in ("grilling", "smoking"):
-            return "mdi:fire"
-        elif val == "fan_mode":
-            return "mdi:fan"
-        elif val == "online":
-            return "mdi:grill"
-        return "mdi:grill-outline"
+        return _STATUS_ICONS.get(self._attr_native_value, "mdi:grill-outline")
+
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
+        new_val = self._attr_native_value
         if self.coordinator.data:
-            grill_data = self.coordinator.data.get("grills", {}).get(self._grill_id)
-            if grill_data and grill_data.get("online"):
-                state = grill_data.get("state", {})
+            # The online flag is exactly "state is not None", so the
+            # version check covers it too: _ver is absent when offline
+            state = _get_state(self.coordinator, self._grill_id)
+            ver = state.get("_ver") if state else None
+            if ver is not None and ver == self._last_ver:
+                return
+            self._last_ver = ver
+            if state:
                 grill_state = state.get("grillState", 0)
-                self._attr_native_value = GRILL_STATES.get(grill_state, "active")
+                new_val = (
+                    GRILL_STATES[grill_state]
+                    if 0 <= grill_state < len(GRILL_STATES)
+                    else "active"
+                )
             else:
-                self._attr_native_value = "offline"
+                new_val = "offline"
+        if new_val == self._attr_native_value:
+            return
+        self._attr_native_value = new_val
         self.async_write_ha_state()
 
 
@@ -217,6 +344,8 @@ class GMGWarningSensor(CoordinatorEntity, SensorEntity):
     4=auger_disconnect, 5=fan_disconnect.
     """
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_ver")
+
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: DataUpdateCoordinator, grill: dict) -> None:
@@ -224,32 +353,19 @@ class GMGWarningSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_warning"
         self._attr_name = "Warning"
         self._attr_native_value = "none"
+        self._last_ver: int | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
-        val = self._attr_native_value
-        if val == "none":
-            return "mdi:check-circle-outline"
-        elif val == "low_pellets":
-            return "mdi:fire-alert"
-        elif val in ("fan_mode", "fan_disconnect"):
-            return "mdi:fan-alert"
-        elif val == "ignitor_disconnect":
-            return "mdi:fire-off"
-        elif val == "auger_disconnect":
-            return "mdi:cog-off"
-        return "mdi:alert-circle"
+        return _WARNING_ICONS.get(self._attr_native_value, "mdi:alert-circle")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -258,14 +374,41 @@ class GMGWarningSensor(CoordinatorEntity, SensorEntity):
             return {"warning_code": state.get("warningCode", 0)}
         return {}
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
+        ver = state.get("_ver") if state else None
+        if ver is not None and ver == self._last_ver:
+            return
+        self._last_ver = ver
         if state:
             code = state.get("warningCode", 0)
-            self._attr_native_value = WARNING_CODES.get(code, f"unknown_{code}")
+            new_val = (
+                WARNING_CODES[code]
+                if 0 <= code < len(WARNING_CODES)
+                else f"unknown_{code}"
+            )
         else:
-            self._attr_native_value = "none"
+            new_val = "none"
+        # The warning code maps 1:1 onto the value, so this also covers
+        # the warning_code extra attribute
+        if new_val == self._attr_native_value:
+            return
+        self._attr_native_value = new_val
         self.async_write_ha_state()
 
 
@@ -277,6 +420,8 @@ class GMGFireStateSensor(CoordinatorEntity, SensorEntity):
     4=cool_down, 5=fail, 198=cold_smoke.
     """
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_progress", "_last_ver")
+
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: DataUpdateCoordinator, grill: dict) -> None:
@@ -284,34 +429,20 @@ class GMGFireStateSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_fire_state"
         self._attr_name = "Fire State"
         self._attr_native_value = None
+        self._last_progress: int | None = None
+        self._last_ver: int | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
-        val = self._attr_native_value
-        if val == "running":
-            return "mdi:fire"
-        elif val == "startup":
-            return "mdi:fire-alert"
-        elif val == "cool_down":
-            return "mdi:fan"
-        elif val == "cold_smoke":
-            return "mdi:smoke"
-        elif val == "fail":
-            return "mdi:alert-circle"
-        elif val in ("off", "default"):
-            return "mdi:fire-off"
-        return "mdi:fire-off"
+        return _FIRE_STATE_ICONS.get(self._attr_native_value, "mdi:fire-off")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -323,20 +454,48 @@ class GMGFireStateSensor(CoordinatorEntity, SensorEntity):
             }
         return {}
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
+        ver = state.get("_ver") if state else None
+        if ver is not None and ver == self._last_ver:
+            return
+        self._last_ver = ver
+        progress = None
         if state:
             code = state.get("fireState", 0)
-            self._attr_native_value = FIRE_STATES.get(code, f"unknown_{code}")
+            new_val = FIRE_STATES.get(code, f"unknown_{code}")
+            progress = state.get("fireStateProgress", 0)
         else:
-            self._attr_native_value = None
+            new_val = None
+        # Progress is exposed as an extra attribute, so it must be part
+        # of the change check
+        if new_val == self._attr_native_value and progress == self._last_progress:
+            return
+        self._attr_native_value = new_val
+        self._last_progress = progress
         self.async_write_ha_state()
 
 
 class GMGProfileSensor(CoordinatorEntity, SensorEntity):
     """GMG cook profile status sensor."""
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_attrs_sig", "_last_ver")
+
     _attr_has_entity_name = True
 
     def __init__(self, coordinator: DataUpdateCoordinator, grill: dict) -> None:
@@ -344,23 +503,20 @@ class GMGProfileSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_profile"
         self._attr_name = "Cook Profile"
         self._attr_native_value = "none"
+        self._last_attrs_sig: tuple | None = None
+        self._last_ver: int | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
-        if self._attr_native_value != "none":
-            return "mdi:playlist-play"
-        return "mdi:playlist-remove"
+        return _PROFILE_ICONS[self._attr_native_value != "none"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -382,27 +538,59 @@ class GMGProfileSensor(CoordinatorEntity, SensorEntity):
             }
         return {}
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
+        ver = state.get("_ver") if state else None
+        if ver is not None and ver == self._last_ver:
+            return
+        self._last_ver = ver
+        attrs_sig = None
         if state:
             profile_id = state.get("curProfileId", 0)
             paused = state.get("curProfilePaused", 0)
             if profile_id > 0:
-                if paused:
-                    self._attr_native_value = "paused"
-                else:
-                    self._attr_native_value = "active"
+                new_val = "paused" if paused else "active"
             else:
-                self._attr_native_value = "none"
+                new_val = "none"
+            # Signature of the extra attributes (remaining time counts
+            # down while a profile runs, so it must trigger writes)
+            attrs_sig = (
+                profile_id,
+                state.get("curProfileStepId", 0),
+                state.get("numProfileSteps", 0),
+                paused,
+                state.get("profileRemainingTime", 0),
+                state.get("profileEndMode", 0),
+            )
         else:
-            self._attr_native_value = "none"
+            new_val = "none"
+        if new_val == self._attr_native_value and attrs_sig == self._last_attrs_sig:
+            return
+        self._attr_native_value = new_val
+        self._last_attrs_sig = attrs_sig
         self.async_write_ha_state()
 
 
 class GMGFirmwareSensor(CoordinatorEntity, SensorEntity):
     """GMG firmware version sensor."""
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_ver")
+
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -411,18 +599,16 @@ class GMGFirmwareSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_firmware"
         self._attr_name = "Firmware Version"
         self._attr_native_value = None
+        self._last_ver: int | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
         return "mdi:chip"
@@ -434,19 +620,39 @@ class GMGFirmwareSensor(CoordinatorEntity, SensorEntity):
             return {"software_path": state.get("softwarePath")}
         return {}
 
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
-        if state:
-            self._attr_native_value = state.get("firmwareVersion")
-        else:
-            self._attr_native_value = None
+        ver = state.get("_ver") if state else None
+        if ver is not None and ver == self._last_ver:
+            return
+        self._last_ver = ver
+        new_val = state.get("firmwareVersion") if state else None
+        if new_val == self._attr_native_value:
+            return
+        self._attr_native_value = new_val
         self.async_write_ha_state()
 
 
 class GMGLastUpdatedSensor(CoordinatorEntity, SensorEntity):
     """GMG last updated timestamp sensor."""
 
+    __slots__ = ("_grill", "_grill_id", "_grill_name", "_last_ts")
+
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -456,41 +662,62 @@ class GMGLastUpdatedSensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._attr_unique_id = f"gmg_cloud_{self._grill_id}_last_updated"
         self._attr_name = "Last Updated"
         self._attr_native_value = None
+        self._last_ts: str | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        from datetime import datetime, timezone
-
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
         if state:
             ts = state.get("lastUpdated")
-            if ts:
-                try:
-                    # Parse ISO timestamp, handle nanoseconds by truncating
-                    # e.g. "2026-02-08T06:36:20.744505113Z"
-                    if "." in ts:
-                        base, frac = ts.split(".")
-                        frac = frac.rstrip("Z")[:6]  # Truncate to microseconds
-                        ts = f"{base}.{frac}+00:00"
-                    else:
-                        ts = ts.rstrip("Z") + "+00:00"
-                    self._attr_native_value = datetime.fromisoformat(ts)
-                except (ValueError, TypeError):
-                    self._attr_native_value = None
-            else:
-                self._attr_native_value = None
+            # Compare the raw string before parsing -- unchanged
+            # timestamps skip both the parse and the state write
+            if ts == self._last_ts:
+                return
+            self._last_ts = ts
+            new_val = None
+            # Guard the type too -- a non-string lastUpdated must not
+            # raise out of the listener loop
+            if ts and isinstance(ts, str):
+                match = _TS_RE.match(ts)
+                if match:
+                    year, month, day, hour, minute, second, frac = match.groups()
+                    # Nanoseconds truncate to microseconds
+                    micros = int((frac or "0")[:6].ljust(6, "0"))
+                    new_val = datetime(
+                        int(year),
+                        int(month),
+                        int(day),
+                        int(hour),
+                        int(minute),
+                        int(second),
+                        micros,
+                        timezone.utc,
+                    )
+            self._attr_native_value = new_val
         else:
+            self._last_ts = None
             self._attr_native_value = None
         self.async_write_ha_state()
 
@@ -530,6 +757,18 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
     temperature, based on linear regression of recent readings.
     """
 
+    __slots__ = (
+        "_grill",
+        "_grill_id",
+        "_grill_name",
+        "_probe_num",
+        "_temp_field",
+        "_target_field",
+        "_samples",
+        "_rate_per_minute",
+        "_last_sig",
+    )
+
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
@@ -552,6 +791,7 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
         self._grill = grill
         self._grill_id = grill.get("grillId", "unknown")
         self._grill_name = grill.get("grillName", "GMG Grill")
+        self._attr_device_info = _device_info(grill, self._grill_id, self._grill_name)
         self._probe_num = probe_num
         self._temp_field = temp_field
         self._target_field = target_field
@@ -563,25 +803,18 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
         self._attr_name = f"Probe {probe_num} ETA"
         self._attr_native_value = None
         self._rate_per_minute: float | None = None
+        self._last_sig: tuple | None = None
 
     @property
     def available(self) -> bool:
         return True
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return _device_info(self._grill, self._grill_id, self._grill_name)
-
     @property
     def icon(self) -> str:
-        if self._attr_native_value is not None:
-            return "mdi:timer-sand"
-        return "mdi:timer-off-outline"
+        return _ETA_ICONS[self._attr_native_value is not None]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        from datetime import datetime, timezone, timedelta
-
         attrs: dict[str, Any] = {}
         state = _get_state(self.coordinator, self._grill_id)
         if state:
@@ -603,12 +836,39 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
             attrs["eta_timestamp"] = None
         return attrs
 
+    @callback
+    def _write_if_changed(self) -> None:
+        """Write state only when the value, rate, or sample count moved."""
+        sig = (
+            self._attr_native_value,
+            self._rate_per_minute,
+            len(self._samples),
+        )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Seed entity state from data the coordinator already holds.
+
+        With always_update=False the coordinator only notifies when the
+        payload changes, so a static grill would otherwise leave the
+        entity at its __init__ defaults after a restart.
+        """
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.hass is None or self.entity_id is None or not self.enabled:
+            # Not added to hass yet, or disabled in the registry --
+            # nothing will consume the state write
+            return
         state = _get_state(self.coordinator, self._grill_id)
         if not state:
             self._attr_native_value = None
-            self.async_write_ha_state()
+            self._write_if_changed()
             return
 
         current_temp = state.get(self._temp_field)
@@ -622,14 +882,14 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
         if not target_temp or target_temp <= 0:
             self._attr_native_value = None
             self._rate_per_minute = None
-            self.async_write_ha_state()
+            self._write_if_changed()
             return
 
         # Already at or above target
         if current_temp is not None and current_temp >= target_temp:
             self._attr_native_value = 0
             self._rate_per_minute = None
-            self.async_write_ha_state()
+            self._write_if_changed()
             return
 
         # Compute rate via linear regression
@@ -639,7 +899,7 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
         if rate is None or rate <= 0.05:
             # Not heating (stalled, cooling, or insufficient data)
             self._attr_native_value = None
-            self.async_write_ha_state()
+            self._write_if_changed()
             return
 
         remaining = (target_temp - current_temp) / rate
@@ -649,4 +909,16 @@ class GMGProbeETASensor(CoordinatorEntity, SensorEntity):
         else:
             self._attr_native_value = round(remaining, 1)
 
-        self.async_write_ha_state()
+        self._write_if_changed()
+
+
+# Status sensor classes instantiated once per grill; defined here so the
+# table can reference the classes above.
+_STATUS_SENSOR_CLASSES = (
+    GMGStatusSensor,
+    GMGWarningSensor,
+    GMGFireStateSensor,
+    GMGProfileSensor,
+    GMGFirmwareSensor,
+    GMGLastUpdatedSensor,
+)